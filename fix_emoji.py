@@ -4,28 +4,35 @@
 
 import os
 
-# Read the file
-with open('main_beautiful.py', 'r', encoding='utf-8', errors='ignore') as f:
-    content = f.read()
+TARGET = 'main_beautiful.py'
 
-# Replace the broken line with the correct one
-old_line = '        "� Alt News (Fact-checker) - https://www.altnews.in",'
-new_line = '        "📺 Alt News (Fact-checker) - https://www.altnews.in",'
+# Work on raw bytes so no other byte in the file is decoded or dropped
+REPLACEMENT = '"📺 Alt News'.encode('utf-8')
 
-# Try different possible corrupted versions
-possible_corrupted = [
-    '        "� Alt News (Fact-checker) - https://www.altnews.in",',
-    '        "��� Alt News (Fact-checker) - https://www.altnews.in",',
+# Try different possible corrupted versions (U+FFFD replacement characters)
+CORRUPTED = [
+    '"��� Alt News'.encode('utf-8'),
+    '"� Alt News'.encode('utf-8'),
 ]
 
-for corrupted in possible_corrupted:
-    if corrupted in content:
-        content = content.replace(corrupted, new_line)
-        print(f"Replaced: {corrupted[:30]}...")
-        break
+with open(TARGET, 'rb') as f:
+    data = f.read()
 
-# Write back
-with open('main_beautiful.py', 'w', encoding='utf-8') as f:
-    f.write(content)
+changed = False
+for needle in CORRUPTED:
+    new_data = data.replace(needle, REPLACEMENT)
+    if new_data != data:
+        data = new_data
+        changed = True
+        print(f"Replaced: {needle.decode('utf-8')}...")
+        break
 
-print("✅ Fixed Alt News emoji successfully!")
+if changed:
+    # Write to a temp file and swap it in atomically
+    tmp_path = TARGET + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, TARGET)
+    print("✅ Fixed Alt News emoji successfully!")
+else:
+    print("ℹ️ No broken Alt News emoji found, nothing to fix.")
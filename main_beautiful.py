@@ -1,11 +1,21 @@
 import streamlit as st
 import google.generativeai as genai
-import json
-from datetime import datetime
+from google.api_core import exceptions as google_exceptions
+import orjson
+import html
 import time
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
 import os
+import re
+import threading
+from collections import Counter
+from itertools import islice
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -21,11 +31,22 @@ class AppConfig:
     # API Configuration - Load from environment variables
     GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
     
+    # Model names tried in order until one accepts requests
+    GEMINI_MODELS = [
+        'gemini-2.5-flash',
+        'gemini-flash-latest',
+        'models/gemini-2.5-flash',
+        'models/gemini-flash-latest'
+    ]
+    
     # Application Settings
     APP_TITLE = "Fake News Verifier"
     APP_SUBTITLE = "AI-Powered Fake News Detection • Advanced AI Technology"
     VERSION = "2.0"
     
+    # Show extra diagnostics (e.g. URL extraction details) when DEBUG=true
+    DEBUG = os.getenv('DEBUG', '').lower() in ('1', 'true', 'yes')
+    
     # UI Theme Colors
     COLORS = {
         # New theme colors (teal / dark slate) - feel free to change these
@@ -51,11 +72,103 @@ class AppConfig:
         "🔍 Boom Live (Fact-checker) - https://www.boomlive.in",
         "🔍 The Quint WebQoof - https://www.thequint.com/news/webqoof"
     ]
+    
+    # Sources attached to every verification result (copy before mutating)
+    TOP_SOURCES = tuple(TRUSTED_SOURCES[:4])
 
 # ============================================
 # CORE VERIFICATION ENGINE
 # ============================================
 
+# Status and confidence patterns used to parse the AI reply
+_STATUS_RE = re.compile(r'VERIFICATION_STATUS:\s*(TRUE|FALSE|PARTIALLY_TRUE|UNVERIFIED)\b')
+_CONF_RE = re.compile(r'CONFIDENCE_SCORE:\s*(\d+)')
+
+# status -> (default confidence, lowest sensible score, value used below it)
+_STATUS_MAP = {
+    'TRUE': (85, 60, 75),
+    'FALSE': (90, 70, 80),
+    'PARTIALLY_TRUE': (70, 50, 65),
+    'UNVERIFIED': (30, None, None),
+}
+_UNVERIFIED_MAX_CONFIDENCE = 50
+
+# Shorter AI replies cannot hold even the shortest parseable status line
+# ("VERIFICATION_STATUS: TRUE"), so they are treated as error stubs
+_MIN_AI_TEXT_CHARS = len('VERIFICATION_STATUS: TRUE')
+
+# Prompt sent to the AI for every claim; only {{CLAIM}} is filled in per call
+_ANALYSIS_PROMPT = """
+        🇮🇳 INDIAN NEWS FACT-CHECK ANALYSIS
+        =====================================
+        
+        You are an expert Indian news fact-checker with deep knowledge of:
+        - Indian politics, government, and current affairs
+        - Indian media landscape and reliable sources
+        - Indian cultural and social context
+        - Common misinformation patterns in India
+        
+        NEWS CLAIM TO ANALYZE:
+        "{{CLAIM}}"
+        
+        Please provide analysis in this EXACT format:
+        
+        VERIFICATION_STATUS: [TRUE/FALSE/PARTIALLY_TRUE/UNVERIFIED]
+        CONFIDENCE_SCORE: [0-100]
+        
+        DETAILED_ANALYSIS:
+        [Provide thorough explanation of why this claim is true/false]
+        
+        INDIAN_CONTEXT:
+        [Explain relevance to Indian politics, society, current events]
+        
+        EVIDENCE_CHECK:
+        [What evidence supports or contradicts this claim]
+        
+        RECOMMENDED_SOURCES:
+        [List specific Indian news sources to verify this claim]
+        
+        RED_FLAGS:
+        [Any warning signs or suspicious elements in this claim]
+        
+        CONCLUSION:
+        [Final assessment with reasoning]
+        """
+
+def _now():
+    """Current local time formatted for result timestamps"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
+def _normalize_claim(news_claim):
+    """Cache key for a news claim, ignoring case and any whitespace differences"""
+    return ' '.join(news_claim.split()).lower()
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_ai_text(claim_key, _model, _prompt):
+    """
+    Fetch the AI analysis for a claim, cached on its normalized text
+    Failures raise, so they are never stored in the cache
+    """
+    response = _model.generate_content(_prompt)
+    
+    if not response or not response.text:
+        raise ValueError("No response from AI")
+    
+    if len(response.text.strip()) < _MIN_AI_TEXT_CHARS:
+        raise ValueError("Empty AI response")
+    
+    return response.text
+
+@dataclass(slots=True, frozen=True)
+class VerifyResult:
+    """Outcome of one verification, kept in session state between reruns"""
+    status: str
+    confidence: int
+    analysis: str
+    timestamp: str
+    sources: tuple
+    success: bool
+
 class IndianNewsVerifier:
     """
     Advanced Indian News Verification Engine
@@ -65,6 +178,10 @@ class IndianNewsVerifier:
     def __init__(self):
         """Initialize the verification engine"""
         self.model = None
+        self._model_index = 0
+        # One engine serves every session, so moving to the next model
+        # happens under a lock
+        self._model_lock = threading.Lock()
         self.is_ready = False
         self._setup_gemini_ai()
     
@@ -79,34 +196,36 @@ class IndianNewsVerifier:
             # Configure AI API
             genai.configure(api_key=AppConfig.GEMINI_API_KEY)
             
-            # Try multiple model versions for reliability
-            model_options = [
-                'gemini-2.5-flash',
-                'gemini-flash-latest',
-                'models/gemini-2.5-flash',
-                'models/gemini-flash-latest'
-            ]
-            
-            for model_name in model_options:
-                try:
-                    self.model = genai.GenerativeModel(model_name)
-                    
-                    # Test the model
-                    test_response = self.model.generate_content("Test")
-                    
-                    if test_response and test_response.text:
-                        self.is_ready = True
-                        break
-                        
-                except Exception:
-                    continue
+            # No probe request here: the model is validated by the first
+            # real verification, which falls back to the next name if needed
+            self._model_index = 0
+            self.model = self._try_model(AppConfig.GEMINI_MODELS[0])
+            self.is_ready = True
             
-            if not self.is_ready:
-                st.error("❌ Could not initialize AI engine")
-                
         except Exception as e:
             st.error(f"🚫 Setup Error: {str(e)}")
     
+    def _try_model(self, model_name):
+        """Create a model handle without making any API call"""
+        return genai.GenerativeModel(model_name)
+    
+    def _generate(self, claim_key, prompt):
+        """Get the AI analysis, moving to the next model if the current one is unavailable"""
+        while True:
+            with self._model_lock:
+                model_index, model = self._model_index, self.model
+            try:
+                return _cached_ai_text(claim_key, model, prompt)
+            except (google_exceptions.NotFound, google_exceptions.PermissionDenied):
+                with self._model_lock:
+                    # Another session may have moved on already; only
+                    # advance past the model this call actually tried
+                    if self._model_index == model_index:
+                        if model_index + 1 >= len(AppConfig.GEMINI_MODELS):
+                            raise
+                        self._model_index = model_index + 1
+                        self.model = self._try_model(AppConfig.GEMINI_MODELS[self._model_index])
+    
     def verify_news(self, news_claim):
         """
         Main verification method
@@ -119,151 +238,328 @@ class IndianNewsVerifier:
             # Create comprehensive analysis prompt
             analysis_prompt = self._create_analysis_prompt(news_claim)
             
-            # Get AI response
-            response = self.model.generate_content(analysis_prompt)
-            
-            if not response or not response.text:
-                return self._create_error_response("No response from AI")
+            # Get AI response (repeated claims are served from the cache)
+            ai_text = self._generate(_normalize_claim(news_claim), analysis_prompt)
             
             # Parse and structure the response
-            return self._parse_ai_response(response.text)
+            return self._parse_ai_response(ai_text)
             
         except Exception as e:
             return self._create_error_response(f"Analysis failed: {str(e)}")
     
     def _create_analysis_prompt(self, news_claim):
         """Create a comprehensive prompt for Indian news analysis"""
-        return f"""
-        🇮🇳 INDIAN NEWS FACT-CHECK ANALYSIS
-        =====================================
-        
-        You are an expert Indian news fact-checker with deep knowledge of:
-        - Indian politics, government, and current affairs
-        - Indian media landscape and reliable sources
-        - Indian cultural and social context
-        - Common misinformation patterns in India
-        
-        NEWS CLAIM TO ANALYZE:
-        "{news_claim}"
-        
-        Please provide analysis in this EXACT format:
-        
-        VERIFICATION_STATUS: [TRUE/FALSE/PARTIALLY_TRUE/UNVERIFIED]
-        CONFIDENCE_SCORE: [0-100]
-        
-        DETAILED_ANALYSIS:
-        [Provide thorough explanation of why this claim is true/false]
-        
-        INDIAN_CONTEXT:
-        [Explain relevance to Indian politics, society, current events]
-        
-        EVIDENCE_CHECK:
-        [What evidence supports or contradicts this claim]
-        
-        RECOMMENDED_SOURCES:
-        [List specific Indian news sources to verify this claim]
-        
-        RED_FLAGS:
-        [Any warning signs or suspicious elements in this claim]
-        
-        CONCLUSION:
-        [Final assessment with reasoning]
-        """
+        return _ANALYSIS_PROMPT.replace("{{CLAIM}}", news_claim)
     
     def _parse_ai_response(self, ai_text):
         """Parse AI response into structured format"""
         try:
-            # Extract verification status
             status = "UNVERIFIED"
             confidence = 50
             
-            # Look for status in AI response
-            if "VERIFICATION_STATUS: TRUE" in ai_text:
-                status = "TRUE"
-                confidence = 85
-            elif "VERIFICATION_STATUS: FALSE" in ai_text:
-                status = "FALSE" 
-                confidence = 90
-            elif "VERIFICATION_STATUS: PARTIALLY_TRUE" in ai_text:
-                status = "PARTIALLY_TRUE"
-                confidence = 70
-            elif "VERIFICATION_STATUS: UNVERIFIED" in ai_text:
-                status = "UNVERIFIED"
-                confidence = 30
-            
-            # Try to extract confidence score from AI response
-            import re
-            conf_match = re.search(r'CONFIDENCE_SCORE:\s*(\d+)', ai_text)
-            if conf_match:
-                extracted_confidence = int(conf_match.group(1))
+            match = _STATUS_RE.search(ai_text)
+            if match:
+                status = match.group(1)
+                confidence, floor, fallback = _STATUS_MAP[status]
+                
                 # Only use extracted confidence if it makes sense with the status
-                if status == "UNVERIFIED" and extracted_confidence > 50:
-                    confidence = min(extracted_confidence, 50)  # Cap at 50% for unverified
-                elif status in ["TRUE", "FALSE", "PARTIALLY_TRUE"]:
-                    confidence = extracted_confidence
+                conf_match = _CONF_RE.search(ai_text)
+                if conf_match:
+                    extracted_confidence = int(conf_match.group(1))
+                    if floor is None:
+                        # Cap at 50% for unverified
+                        if extracted_confidence > _UNVERIFIED_MAX_CONFIDENCE:
+                            confidence = _UNVERIFIED_MAX_CONFIDENCE
+                    elif extracted_confidence >= floor:
+                        confidence = extracted_confidence
+                    else:
+                        confidence = fallback
             
-            # Ensure logical confidence ranges
-            if status == "UNVERIFIED" and confidence > 50:
-                confidence = 30
-            elif status == "TRUE" and confidence < 60:
-                confidence = 75
-            elif status == "FALSE" and confidence < 70:
-                confidence = 80
-            elif status == "PARTIALLY_TRUE" and confidence < 50:
-                confidence = 65
-            
-            return {
-                'status': status,
-                'confidence': confidence,
-                'analysis': ai_text,
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'sources': AppConfig.TRUSTED_SOURCES[:4],  # Top 4 sources
-                'success': True
-            }
+            return VerifyResult(
+                status=status,
+                confidence=confidence,
+                analysis=ai_text,
+                timestamp=_now(),
+                sources=AppConfig.TOP_SOURCES,  # Top 4 sources
+                success=True
+            )
             
         except Exception as e:
             return self._create_error_response(f"Parse error: {str(e)}")
     
     def _create_error_response(self, error_message):
         """Create standardized error response"""
-        return {
-            'status': 'ERROR',
-            'confidence': 0,
-            'analysis': f"❌ {error_message}",
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'sources': [],
-            'success': False
-        }
+        return VerifyResult(
+            status='ERROR',
+            confidence=0,
+            analysis=f"❌ {error_message}",
+            timestamp=_now(),
+            sources=(),
+            success=False
+        )
+
+@st.cache_resource
+def _shared_verifier():
+    """Verification engine shared by all sessions of this server process"""
+    return IndianNewsVerifier()
+
+def get_verifier():
+    """
+    Get the shared verification engine
+    An engine whose setup failed is not kept, so the next rerun tries again
+    """
+    verifier = _shared_verifier()
+    if not verifier.is_ready:
+        _shared_verifier.clear()
+    return verifier
 
 # ============================================
 # USER INTERFACE COMPONENTS
 # ============================================
 
-class BeautifulUI:
-    """Beautiful and responsive user interface components"""
+# Article extraction patterns, named here for readability. Streamlit reruns
+# this whole script, so they are recompiled each run (cheaply, from re's cache)
+_ARTICLE_CLASS_RE = re.compile(r'article[-_]?body|article[-_]?content|story[-_]?body|post[-_]?content', re.I)
+_ARTICLE_ID_RE = re.compile(r'article|story|content|post', re.I)
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Browser headers sent with every URL extraction request
+_HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+}
+
+@st.cache_resource
+def _http_session():
+    """
+    HTTP session for URL extraction, shared by every rerun and session
+    Pooled connections mean no new TLS handshake per fetch to a known host
+    """
+    session = requests.Session()
+    session.headers.update(_HTTP_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # Only connection failures are retried. read=False re-raises a read
+        # error straight away instead of wrapping it in MaxRetryError, so a
+        # read timeout still surfaces as requests' ReadTimeout
+        max_retries=Retry(total=2, read=False, backoff_factor=0.3)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Upper bound on how much of a page is downloaded for extraction
+_MAX_PAGE_BYTES = 512 * 1024
+
+# (connect, read) timeouts in seconds: an unreachable host fails fast instead
+# of holding the session for the whole read budget. Google News links get a
+# longer read for the redirect hop. The read timeout bounds each wait for
+# data, not the whole download: a host that keeps trickling bytes can take
+# longer, though never past _MAX_PAGE_BYTES
+_FETCH_TIMEOUT = (3.05, 10)
+_GOOGLE_NEWS_TIMEOUT = (3.05, 15)
+
+# Parts of a page worth building into the tree: the rest of <head> (inline
+# scripts, styles, JSON-LD, meta tags) is skipped at parse time
+_PAGE_STRAINER = SoupStrainer(['title', 'body'])
+
+# Shortest extracted text accepted as an article
+_MIN_ARTICLE_CHARS = 80
+
+def _long_texts(tags, min_chars=30):
+    """Lazily yield the stripped text of each tag longer than min_chars"""
+    for tag in tags:
+        # Plain get_text(): a separator would split inline tags from
+        # the punctuation that follows them ("Minister 's")
+        text = tag.get_text().strip()
+        if len(text) > min_chars:
+            yield text
+
+def _extract_article_structure(soup):
+    """Method 1: Look for specific news article structures"""
+    # Evaluated lazily so later lookups only run if earlier ones fail
+    article_finders = (
+        lambda: soup.find('article'),
+        lambda: soup.find('div', class_=_ARTICLE_CLASS_RE),
+        lambda: soup.find('div', id=_ARTICLE_ID_RE),
+        lambda: soup.find('main')
+    )
     
-    @staticmethod
-    def setup_page_config():
-        """Configure Streamlit page settings"""
-        st.set_page_config(
-            page_title="Fake News Detector",
-            page_icon="🕵️‍♂️",
-            layout="wide",
-            initial_sidebar_state="expanded"
-        )
+    for finder in article_finders:
+        selector = finder()
+        if selector:
+            paragraphs = selector.find_all(['p', 'h2', 'h3'])
+            text = ' '.join(_long_texts(paragraphs))
+            if text:
+                return text
+    return ""
+
+def _extract_paragraph_container(soup):
+    """Method 2: Find the longest paragraph-rich container"""
+    # One pass over <p> tags, counting them per parent <div>
+    # (keyed by id() because hashing a Tag serializes it)
+    parent_divs = {}
+    parent_counts = Counter()
+    for p in soup.find_all('p'):
+        if p.parent.name == 'div':
+            parent_divs[id(p.parent)] = p.parent
+            parent_counts[id(p.parent)] += 1
+    
+    if not parent_counts:
+        return ""
+    
+    max_para_count = max(parent_counts.values())
+    if max_para_count < 3:
+        return ""
+    
+    # On a tie keep the div that opens first in the document. <p> order is
+    # not div order once divs nest, so ties walk the <div>s themselves
+    tied = [key for key, count in parent_counts.items() if count == max_para_count]
+    if len(tied) == 1:
+        best = parent_divs[tied[0]]
+    else:
+        best = next(div for div in soup.find_all('div')
+                    if parent_counts[id(div)] == max_para_count)
+    
+    paragraphs = best.find_all('p')
+    return ' '.join(_long_texts(paragraphs))
+
+def _extract_all_paragraphs(soup):
+    """Method 3: Get all meaningful paragraphs (relaxed filtering)"""
+    paragraphs = soup.find_all('p')
+    # Take first 50 paragraphs to avoid getting too much junk; the rest
+    # never have their text extracted
+    return ' '.join(islice(_long_texts(paragraphs), 50))
+
+def _extract_full_body(soup):
+    """Method 4: Last resort - get ALL text content"""
+    # Get all text from body, split by sentences
+    body = soup.find('body')
+    if not body:
+        return ""
+    
+    all_text = body.get_text(separator=' ', strip=True)
+    # Clean up
+    all_text = ' '.join(all_text.split())
+    # Split into sentences and filter
+    sentences = _SENT_RE.split(all_text)
+    meaningful_sentences = [s.strip() for s in sentences if len(s.strip()) > 50]
+    return '. '.join(meaningful_sentences[:30])  # Take first 30 sentences
+
+# Extraction methods in the order they are tried
+_EXTRACTION_METHODS = (
+    ("article structure", _extract_article_structure),
+    ("paragraph container", _extract_paragraph_container),
+    ("all paragraphs", _extract_all_paragraphs),
+    ("full body text", _extract_full_body),
+)
+
+def _extract_with_methods(soup):
+    """
+    Try the extraction methods in order and return (text, method) from the
+    first one that finds enough text, so well-structured pages need one walk
+    Falls back to the first non-empty result if none is long enough
+    """
+    fallback = ("", "")
+    for method, extract in _EXTRACTION_METHODS:
+        # Remove extra whitespace
+        text = ' '.join(extract(soup).split())
+        if len(text) > _MIN_ARTICLE_CHARS:
+            return text, method
+        if text and not fallback[0]:
+            fallback = (text, method)
+    return fallback
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _extract_article(url):
+    """
+    Fetch a news URL and extract the article text
+    Cached per URL so reruns don't refetch and reparse the same page
+    """
+    timeout = _GOOGLE_NEWS_TIMEOUT if 'news.google.com' in url else _FETCH_TIMEOUT
+    # The with block releases the streamed connection back to the pool on
+    # every path, including raise_for_status() and read errors
+    with _http_session().get(url, timeout=timeout, allow_redirects=True, stream=True) as response:
+        article = {
+            'text': "",
+            'title': "",
+            'method': "",
+            'final_url': response.url,
+            'status_code': response.status_code,
+            'page_size': 0
+        }
         
-        # Apply light theme
-        theme = BeautifulUI._get_light_theme()
-        st.markdown(theme, unsafe_allow_html=True)
+        # Google News did not redirect to the publisher, nothing to parse
+        if 'news.google.com' in response.url:
+            return article
+        
+        response.raise_for_status()
+        
+        # Read at most _MAX_PAGE_BYTES; the article body sits well within it
+        # raw.read() bypasses requests' exception wrapping, so urllib3 errors
+        # are mapped to the requests types the form already reports on
+        try:
+            page_bytes = response.raw.read(_MAX_PAGE_BYTES, decode_content=True)
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ReadTimeout(e, request=response.request)
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e, request=response.request)
+        except DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e, request=response.request)
+    article['page_size'] = len(page_bytes)
     
-    @staticmethod
-    def _get_light_theme():
-        """Light theme - Warm Human-Made Theme"""
-        return """
-        <style>
-        /* Import Google Fonts - Warm, friendly, human fonts */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Lora:wght@400;500;600;700&family=Open+Sans:wght@400;500;600;700&display=swap');
+    # Parse raw bytes with the C-based lxml parser; it detects the
+    # encoding itself, so the slow apparent_encoding guess is skipped.
+    # Only <title> and <body> are built into the tree
+    soup = BeautifulSoup(page_bytes, 'lxml', parse_only=_PAGE_STRAINER)
+    
+    # Get page title for context
+    page_title = soup.find('title')
+    title_text = page_title.get_text().strip() if page_title else ""
+    
+    # Remove unwanted elements more aggressively (a strainer can't do this:
+    # it keeps whole subtrees, so scripts nested in <body> still get parsed)
+    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 
+                         'noscript', 'button', 'form', 'img', 'svg', 'video', 'audio']):
+        element.decompose()
+    
+    extracted_text, extraction_method = _extract_with_methods(soup)
+    
+    article['text'] = extracted_text
+    article['title'] = title_text
+    article['method'] = extraction_method
+    return article
+
+# Comments and layout whitespace in the theme markup, stripped by _minified_theme()
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/|<!--.*?-->', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};,>])\s*|(:)\s+')
+
+def _minify_css(markup):
+    """Compact theme markup: no comments, no whitespace around CSS punctuation"""
+    markup = _CSS_COMMENT_RE.sub('', markup)
+    markup = _CSS_SPACE_RE.sub(' ', markup)
+    return _CSS_PUNCT_RE.sub(r'\1\2', markup).strip()
+
+# Light theme - Warm Human-Made Theme (kept readable here; it is sent on every
+# run, so _minified_theme() below compacts it once per process)
+_LIGHT_THEME_CSS = """
+        <!-- Google Fonts - Warm, friendly, human fonts. Loaded with <link> instead of
+             a render-blocking @import, and only with the weights the theme uses -->
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@500;600&family=Lora:wght@600;700&family=Open+Sans:wght@400;500;600&display=swap">
         
+        <style>
         /* Hide Streamlit default elements */
         #MainMenu {visibility: hidden;}
         footer {visibility: hidden;}
@@ -282,8 +578,12 @@ class BeautifulUI:
                 #60a5fa 50%,     /* Light medium blue */
                 #93c5fd 75%,     /* Sky blue */
                 #dbeafe 100%     /* Very light blue */
-            );
-            background-attachment: fixed;
+            ) #dbeafe;
+            /* scroll (not fixed) lets the browser cache the painted gradient
+               instead of re-rasterizing it on every scroll frame */
+            background-attachment: scroll;
+            background-size: 100% 100vh;
+            background-repeat: no-repeat;
         }
         
         /* Soft container - organic feel */
@@ -396,23 +696,16 @@ class BeautifulUI:
             box-shadow: 0 4px 12px rgba(129, 199, 132, 0.4) !important;
         }
         
-        /* CARDS & CONTAINERS - Soft paper cards */
-        div[data-testid="stVerticalBlock"] > div:not(:empty) {
-            background: rgba(255, 255, 255, 0.8) !important;
-            border: 2px solid #e0d5c1 !important;
-            border-radius: 12px !important;
-            padding: 1.5rem !important;
-            box-shadow: 0 2px 12px rgba(0, 0, 0, 0.08) !important;
-            position: relative !important;
-            z-index: 1 !important;
-        }
-        
-        /* Hide empty vertical blocks - but NOT in sidebar */
-        div[data-testid="stVerticalBlock"]:empty:not([data-testid="stSidebar"] *) {
-            display: none !important;
-        }
+        /* CARDS & CONTAINERS - Soft paper cards come from the .fnd-card
+           classes below, set only on the blocks meant to look like cards.
+           Widgets, column headings, alerts and the download section sit
+           directly on the page background instead of each in its own card */
         
-        div[data-testid="stVerticalBlock"] > div:empty:not([data-testid="stSidebar"] *) {
+        /* Hide empty vertical blocks - the sidebar rule below has the same
+           specificity and comes later, so it keeps sidebar blocks visible
+           without a costly :not(... *) ancestor check on every element */
+        div[data-testid="stVerticalBlock"]:empty,
+        div[data-testid="stVerticalBlock"] > div:empty {
             display: none !important;
         }
         
@@ -420,9 +713,6 @@ class BeautifulUI:
         [data-testid="stSidebar"] div[data-testid="stVerticalBlock"],
         [data-testid="stSidebar"] div[data-testid="stVerticalBlock"] > div {
             display: block !important;
-            background: transparent !important;
-            border: none !important;
-            box-shadow: none !important;
         }
         
         /* TEXT INPUTS - Natural paper-like forms */
@@ -459,24 +749,6 @@ class BeautifulUI:
             caret-color: #2c3e50 !important;
         }
         
-        /* Blinking cursor animation for text inputs */
-        @keyframes blink-cursor {
-            0%, 49% { 
-                caret-color: #2c3e50;
-            }
-            50%, 100% { 
-                caret-color: transparent;
-            }
-        }
-        
-        .stTextArea > div > div > textarea:focus {
-            animation: blink-cursor 1s step-end infinite !important;
-        }
-        
-        .stTextInput > div > div > input:focus {
-            animation: blink-cursor 1s step-end infinite !important;
-        }
-        
         .stTextInput > div > div > input::placeholder,
         .stTextArea > div > div > textarea::placeholder {
             color: #999 !important;
@@ -609,13 +881,138 @@ class BeautifulUI:
         ::-webkit-scrollbar-thumb:hover {
             background: rgba(200, 149, 99, 0.9);
         }
+        
+        /* RESULT & TIP CARDS - shared by the HTML fragments rendered below;
+           only per-result colours and widths are left inline */
+        .fnd-col-heading {
+            text-align: center;
+            color: #546e7a;
+        }
+        
+        .fnd-verdict {
+            border: 3px solid;
+            border-radius: 15px;
+            padding: 2rem;
+            text-align: center;
+            margin-bottom: 1.5rem;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+        }
+        
+        .fnd-verdict-icon {
+            font-size: 3rem;
+            margin-bottom: 0.5rem;
+        }
+        
+        .fnd-verdict h2 {
+            font-size: 1.8rem;
+            margin: 0.5rem 0;
+            font-weight: 700;
+        }
+        
+        .fnd-verdict p {
+            color: #4a4a4a;
+            font-size: 1rem;
+            margin-top: 0.5rem;
+        }
+        
+        .fnd-card {
+            background: rgba(255, 255, 255, 0.9);
+            border-radius: 12px;
+            padding: 1.5rem;
+            margin-bottom: 1.5rem;
+            border: 2px solid #e0d5c1;
+            box-shadow: 0 2px 12px rgba(0, 0, 0, 0.08);
+        }
+        
+        .fnd-card h3 {
+            color: #5d4037;
+            margin: 0 0 1rem 0;
+            font-size: 1.1rem;
+        }
+        
+        .fnd-conf-value {
+            text-align: center;
+            margin-bottom: 1rem;
+        }
+        
+        .fnd-conf-score {
+            font-size: 3rem;
+            font-weight: 700;
+        }
+        
+        .fnd-conf-label {
+            font-size: 0.9rem;
+            color: #6d6d6d;
+            font-weight: 500;
+        }
+        
+        .fnd-conf-track {
+            background: #e0e0e0;
+            height: 25px;
+            border-radius: 12px;
+            overflow: hidden;
+        }
+        
+        .fnd-conf-bar {
+            height: 100%;
+            transition: width 0.5s;
+        }
+        
+        .fnd-sources {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 0 1rem;
+        }
+        
+        .fnd-source {
+            background: #f7f3e9;
+            padding: 0.8rem;
+            border-radius: 8px;
+            margin-bottom: 0.5rem;
+            border-left: 3px solid #81c784;
+        }
+        
+        .fnd-source-name {
+            color: #5d4037;
+            font-weight: 600;
+            font-size: 0.9rem;
+        }
+        
+        .fnd-tips-card {
+            background: rgba(255, 255, 255, 0.8);
+            padding: 1rem;
+            border-radius: 10px;
+            border: 2px solid #e0d5c1;
+            margin-bottom: 1rem;
+            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);
+        }
+        
+        .fnd-tips-card h4 {
+            color: #5d4037;
+            font-size: 1.05rem;
+        }
+        
+        .fnd-tips-card ul {
+            color: #4a4a4a;
+            font-size: 0.85rem;
+        }
+        
+        .fnd-tips-card p {
+            color: #4a4a4a;
+            font-size: 0.8rem;
+            margin: 0.5rem 0;
+        }
         </style>
         """
-    
-    @staticmethod
-    def render_header():
-        """Render beautiful header section"""
-        st.markdown("""
+
+@st.cache_resource
+def _minified_theme():
+    """Theme markup minified once per process instead of on every rerun"""
+    return _minify_css(_LIGHT_THEME_CSS)
+
+# Static header and sidebar HTML, kept at module level for readability; like
+# everything at this level it is rebuilt on each rerun
+_HEADER_HTML = """
         <div style='text-align: center; padding: 1.5rem 0;'>
             <h1 style='color: #2c3e50; font-size: 4rem; margin-bottom: 1rem; font-family: Lora, Georgia, serif; font-weight: 800;'>
                 🕵️‍♂️ Fake News Detector
@@ -625,17 +1022,283 @@ class BeautifulUI:
             </p>
             <hr style='width: 70%; margin: 1.5rem auto; border: none; height: 1px; background: linear-gradient(90deg, transparent, rgba(212, 197, 169, 0.8), transparent);'>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+_SIDEBAR_TITLE_HTML = """
+<div style='text-align: center; padding: 1rem 0;'>
+    <h2 style='color: #1e3a8a;'>ℹ️ INFO PANEL</h2>
+</div>
+"""
+
+_SIDEBAR_FOOTER_HTML = f"""
+<div style='text-align: center; padding: 1rem 0;'>
+    <p style='color: #5d4037;'>
+        <strong>Version {AppConfig.VERSION}</strong> 🇮🇳
+    </p>
+    <p style='color: #6d6d6d; font-size: 0.9rem;'>
+        Powered by Advanced AI
+    </p>
+</div>
+"""
+
+# Static sidebar content, sent as one markdown element instead of one per block
+_SIDEBAR_BODY = """
+### 🛠️ How It Works
+
+**1. INPUT** 📝  
+Enter news text or paste a URL
+
+**2. ANALYZE** 🤖  
+AI processes the claim using advanced algorithms
+
+**3. RESULTS** ✅  
+Get verification status with confidence score
+
+**4. CROSS-CHECK** 🔍  
+Review recommended sources
+
+---
+
+### 📊 Status Guide
+
+🟢 **TRUE** - Verified as accurate  
+🔴 **FALSE** - Identified as fake  
+🟡 **PARTIAL** - Mixed accuracy  
+⚪ **UNVERIFIED** - Needs more data
+
+---
+
+### ⚠️ Important Note
+
+This AI tool provides analysis, but:
+- Always cross-reference with trusted sources
+- Check official news outlets
+- Look for multiple confirmations
+- Be skeptical of sensational claims
+
+---
+
+### 📰 Trusted Sources
+
+- Times of India
+- NDTV
+- The Hindu
+- Indian Express
+- India Today
+- Anandabazar Patrika
+- The Statesman
+- The Telegraph
+- Alt News (Fact-checker)
+- Boom Live (Fact-checker)
+- The Quint WebQoof (Fact-checker)
+
+---
+"""
+
+# Everything below the toggle button, sent as a single sidebar element
+_SIDEBAR_PANEL = _SIDEBAR_BODY + _SIDEBAR_FOOTER_HTML
+
+# Status indicators with warm, natural colors
+_STATUS_CONFIG = {
+    'TRUE': {
+        'icon': '✅',
+        'color': '#81c784',
+        'bg': 'rgba(129, 199, 132, 0.15)',
+        'label': 'VERIFIED TRUE',
+        'message': 'This news appears to be accurate based on available information.'
+    },
+    'FALSE': {
+        'icon': '❌',
+        'color': '#e57373',
+        'bg': 'rgba(229, 115, 115, 0.15)',
+        'label': 'FAKE NEWS DETECTED',
+        'message': 'This news appears to be false or misleading.'
+    },
+    'PARTIALLY_TRUE': {
+        'icon': '⚠️',
+        'color': '#ffb74d',
+        'bg': 'rgba(255, 183, 77, 0.15)',
+        'label': 'PARTIALLY TRUE',
+        'message': 'This news contains some truth but also inaccurate elements.'
+    },
+    'UNVERIFIED': {
+        'icon': '❓',
+        'color': '#7b93a7',
+        'bg': 'rgba(123, 147, 167, 0.15)',
+        'label': 'UNVERIFIED',
+        'message': 'Insufficient information to verify this claim.'
+    }
+}
+
+# Result card templates, filled in with str.format on each render
+_VERDICT_TMPL = """
+<div class='fnd-verdict' style='background: {bg}; border-color: {color};'>
+    <div class='fnd-verdict-icon'>{icon}</div>
+    <h2 style='color: {color};'>{label}</h2>
+    <p>{message}</p>
+</div>
+"""
+
+_CONFIDENCE_TMPL = """
+<div class='fnd-card'>
+    <h3>🎯 AI Confidence Score</h3>
+    <div class='fnd-conf-value'>
+        <div class='fnd-conf-score' style='color: {color};'>{confidence}%</div>
+        <div class='fnd-conf-label'>{label}</div>
+    </div>
+    <div class='fnd-conf-track'>
+        <div class='fnd-conf-bar' style='background: {color}; width: {confidence}%;'></div>
+    </div>
+</div>
+"""
+
+# (lowest score, bar colour, label), checked from the highest tier down
+_CONF_TIERS = (
+    (70, '#81c784', 'High Confidence'),
+    (50, '#ffb74d', 'Moderate Confidence'),
+    (0, '#e57373', 'Low Confidence'),
+)
+
+_ANALYSIS_HEADER_HTML = """
+<div class='fnd-card'>
+    <h3>🧠 AI Analysis & Evidence</h3>
+</div>
+"""
+
+_SOURCES_HEADER_HTML = """
+<div class='fnd-card'>
+    <h3>� Verify from Trusted Sources</h3>
+    <p style='color: #6d6d6d; font-size: 0.85rem; margin-bottom: 1rem;'>Cross-check this news with these reliable sources:</p>
+</div>
+"""
+
+_TIMESTAMP_TMPL = """
+<div style='text-align: center; color: #6d6d6d; font-size: 0.85rem; margin-top: 1.5rem;'>
+    ⏰ Analysis performed at: <strong>{timestamp}</strong>
+</div>
+<br>
+"""
+
+# Two-column grid of trusted sources, one element instead of one per source
+_SOURCES_HTML = (
+    "<div class='fnd-sources'>"
+    + "".join(
+        f"<div class='fnd-source'><div class='fnd-source-name'>✓ {source}</div></div>"
+        for source in AppConfig.TRUSTED_SOURCES
+    )
+    + "</div>"
+)
+
+# Read-only preview of text extracted from a URL
+_PREVIEW_TMPL = (
+    "<div style='font-size: 0.85em; margin-top: 0.5rem;'>Extracted text preview:</div>"
+    "<pre style='max-height: 150px; overflow: auto; white-space: pre-wrap; background: #fff; "
+    "padding: 0.5rem; border: 1px solid #d4c5a9; border-radius: 8px;'>{text}</pre>"
+)
+
+# Static column content for main(), one markdown element per block
+_INPUT_HEADING_HTML = "<h3 class='fnd-col-heading'>📝 INPUT</h3>"
+
+_RESULTS_HEADING_HTML = "<h3 class='fnd-col-heading'>📊 ANALYSIS</h3>"
+
+_PLACEHOLDER_HTML = """
+<div class='fnd-card' style='text-align: center; padding: 2.5rem 1rem;'>
+    <h2 style='color: #5d4037; font-size: 1.5rem;'>⚡ Ready to Analyze</h2>
+    <p style='color: #4a4a4a; margin-top: 1rem; font-size: 0.95rem;'>
+        Enter news text in the input panel and click <strong style="color: #5d4037;">Verify News</strong> to begin analysis.
+    </p>
+    <p style='color: #6d6d6d; margin-top: 1.5rem; font-size: 0.9rem;'>
+        💡 Try the example to see the AI in action!
+    </p>
+</div>
+"""
+
+# Heading, Quick Tips and Status Guide sent together as one element
+_TIPS_COLUMN_HTML = """
+<h3 class='fnd-col-heading'>💡 TIPS</h3>
+
+<div class='fnd-tips-card'>
+    <h4>🎯 Quick Tips</h4>
+    <ul>
+        <li>Paste full news articles for better accuracy</li>
+        <li>Check multiple sources</li>
+        <li>Look for official sources</li>
+        <li>Be wary of sensational headlines</li>
+    </ul>
+</div>
+
+<div class='fnd-tips-card'>
+    <h4>📈 Status Guide</h4>
+    <p>
+        🟢 <strong style="color: #6bb86f;">TRUE</strong><br/>
+        Verified information
+    </p>
+    <p>
+        🔴 <strong style="color: #e57373;">FALSE</strong><br/>
+        Identified as fake
+    </p>
+    <p>
+        🟡 <strong style="color: #ffb74d;">PARTIAL</strong><br/>
+        Mixed information
+    </p>
+    <p>
+        ⚪ <strong style="color: #7b93a7;">UNVERIFIED</strong><br/>
+        Insufficient data
+    </p>
+</div>
+"""
+
+_FOOTER_HTML = """
+---
+
+<div style='text-align: center; color: #7F8C8D; padding: 2rem 0;'>
+    <p><strong>🕵️‍♂️ Fake News Verifier</strong> • Fighting Misinformation with AI</p>
+    <p>Built with Streamlit • Powered by Advanced AI • Version 2.0</p>
+    <p style='font-family: "Courier New", Courier, monospace;'><em>Made with 📰 by Debasmita X Manisha X Joita</em></p>
+    <p><small>Always cross-reference important news with multiple reliable sources</small></p>
+</div>
+"""
+
+# "YYYY-MM-DD HH:MM:SS" -> "YYYYMMDD_HHMMSS" for report filenames
+_FILENAME_TS = str.maketrans({'-': None, ':': None, ' ': '_'})
+
+class BeautifulUI:
+    """Beautiful and responsive user interface components"""
+    
+    @staticmethod
+    def setup_page_config():
+        """Configure Streamlit page settings"""
+        st.set_page_config(
+            page_title="Fake News Detector",
+            page_icon="🕵️‍♂️",
+            layout="wide",
+            initial_sidebar_state="expanded"
+        )
+        
+        # Apply light theme
+        theme = BeautifulUI._get_light_theme()
+        st.markdown(theme, unsafe_allow_html=True)
+    
+    @staticmethod
+    def _get_light_theme():
+        """Light theme - Warm Human-Made Theme"""
+        return _minified_theme()
+    
+    @staticmethod
+    def render_header():
+        """Render beautiful header section"""
+        st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+    
+    @staticmethod
+    def _toggle_info_panel():
+        """Show or hide the sidebar info panel"""
+        st.session_state.info_panel_visible = not st.session_state.info_panel_visible
     
     @staticmethod
     def render_sidebar():
         """Render enhanced sidebar with info"""
         with st.sidebar:
-            st.markdown("""
-            <div style='text-align: center; padding: 1rem 0;'>
-                <h2 style='color: #1e3a8a;'>ℹ️ INFO PANEL</h2>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_SIDEBAR_TITLE_HTML, unsafe_allow_html=True)
             
             # Initialize session state for panel visibility
             if 'info_panel_visible' not in st.session_state:
@@ -643,9 +1306,10 @@ class BeautifulUI:
             
             # Toggle button
             button_text = "🔼 Hide Info" if st.session_state.info_panel_visible else "🔽 Show Info"
-            if st.button(button_text, use_container_width=True, key="toggle_info_panel"):
-                st.session_state.info_panel_visible = not st.session_state.info_panel_visible
-                st.rerun()
+            # The callback flips the state before the click's own rerun, so no
+            # extra st.rerun() is needed to pick up the new label and content
+            st.button(button_text, use_container_width=True, key="toggle_info_panel",
+                      on_click=BeautifulUI._toggle_info_panel)
             
             st.markdown("---")
             
@@ -653,71 +1317,15 @@ class BeautifulUI:
             if not st.session_state.info_panel_visible:
                 return
             
-            st.markdown("### 🛠️ How It Works")
-            st.markdown("""
-            **1. INPUT** 📝  
-            Enter news text or paste a URL
-            
-            **2. ANALYZE** 🤖  
-            AI processes the claim using advanced algorithms
-            
-            **3. RESULTS** ✅  
-            Get verification status with confidence score
-            
-            **4. CROSS-CHECK** 🔍  
-            Review recommended sources
-            """)
-            
-            st.markdown("---")
-            
-            st.markdown("### 📊 Status Guide")
-            st.markdown("""
-            🟢 **TRUE** - Verified as accurate  
-            🔴 **FALSE** - Identified as fake  
-            🟡 **PARTIAL** - Mixed accuracy  
-            ⚪ **UNVERIFIED** - Needs more data
-            """)
-            
-            st.markdown("---")
-            
-            st.markdown("### ⚠️ Important Note")
-            st.markdown("""
-            This AI tool provides analysis, but:
-            - Always cross-reference with trusted sources
-            - Check official news outlets
-            - Look for multiple confirmations
-            - Be skeptical of sensational claims
-            """)
-            
-            st.markdown("---")
-            
-            st.markdown("### 📰 Trusted Sources")
-            st.markdown("""
-            - Times of India
-            - NDTV
-            - The Hindu
-            - Indian Express
-            - India Today
-            - Anandabazar Patrika
-            - The Statesman
-            - The Telegraph
-            - Alt News (Fact-checker)
-            - Boom Live (Fact-checker)
-            - The Quint WebQoof (Fact-checker)
-            """)
-            
-            st.markdown("---")
-            
-            st.markdown(f"""
-            <div style='text-align: center; padding: 1rem 0;'>
-                <p style='color: #5d4037;'>
-                    <strong>Version {AppConfig.VERSION}</strong> 🇮🇳
-                </p>
-                <p style='color: #6d6d6d; font-size: 0.9rem;'>
-                    Powered by Advanced AI
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_SIDEBAR_PANEL, unsafe_allow_html=True)
+    
+    @staticmethod
+    def _clear_inputs():
+        """Empty the inputs and drop the last result"""
+        st.session_state.news_text_input = ""
+        st.session_state.news_url_input = ""
+        for key in ('last_query', 'last_result'):
+            st.session_state.pop(key, None)
     
     @staticmethod
     def render_verification_form():
@@ -733,15 +1341,11 @@ class BeautifulUI:
         
         news_text = ""
         
-        if input_method == "✏️ Type/Paste Text":
-            news_text = st.text_area(
-                "Enter the news claim:",
-                height=150,
-                placeholder="Click here and start typing... Example: PM Modi announced new education policy today...",
-                help="Click in the text box to start typing or paste the news text you want to verify",
-                key="news_text_input"
-            )
-        else:
+        # The URL box stays outside the form: Enter there reruns on its own and
+        # shows the extraction preview (or paywall errors) before anything is
+        # verified. Inside a form, Enter would submit it as if its first
+        # button, Verify News, had been clicked
+        if input_method == "🔗 News URL":
             url = st.text_input(
                 "Enter news article URL:",
                 placeholder="https://example.com/news-article",
@@ -754,165 +1358,66 @@ class BeautifulUI:
                     st.warning("⚠️ Please enter a valid URL starting with http:// or https://")
                 else:
                     # Extract text from URL
+                    is_google_news = 'news.google.com' in url
                     try:
-                        import requests
-                        from bs4 import BeautifulSoup
-                        from urllib.parse import urlparse, unquote
-                        import re
+                        # One collapsed status element covers the Google News
+                        # notice and the fetch; it turns red if the fetch raises
+                        status_label = ("🔄 Detected Google News link. Extracting original article..."
+                                        if is_google_news else "🌐 Extracting text from URL...")
+                        with st.status(status_label, expanded=False) as status:
+                            article = _extract_article(url)
+                            status.update(label=f"🌐 Page loaded ({article['page_size'] // 1024} KB)",
+                                          state="complete")
                         
-                        with st.spinner("🌐 Extracting text from URL..."):
-                            # Set realistic browser headers
-                            headers = {
-                                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                                'Accept-Language': 'en-US,en;q=0.9',
-                                'Accept-Encoding': 'gzip, deflate, br',
-                                'Connection': 'keep-alive',
-                                'Upgrade-Insecure-Requests': '1',
-                                'Sec-Fetch-Dest': 'document',
-                                'Sec-Fetch-Mode': 'navigate',
-                                'Sec-Fetch-Site': 'none',
-                                'Cache-Control': 'max-age=0',
-                            }
-                            
-                            # Check if it's a Google News link
-                            if 'news.google.com' in url:
-                                st.info("🔄 Detected Google News link. Extracting original article...")
-                                try:
-                                    # Try to extract the actual URL from Google News redirect
-                                    session = requests.Session()
-                                    session.max_redirects = 10
-                                    response = session.get(url, headers=headers, timeout=20, allow_redirects=True)
-                                    final_url = response.url
-                                    
-                                    # Check if we got redirected to a proper article
-                                    if 'news.google.com' not in final_url:
-                                        st.success(f"✅ Found article at: {urlparse(final_url).netloc}")
-                                    else:
-                                        st.warning("⚠️ Could not extract article from Google News. Try opening the article directly and copying its URL.")
-                                        news_text = ""
-                                        raise Exception("Google News redirect failed")
-                                except Exception as e:
-                                    st.error("❌ Google News links often can't be extracted directly. Please:")
-                                    st.info("1. Click the Google News link to open the article\n2. Copy the URL from the article page\n3. Paste that URL here instead")
-                                    news_text = ""
-                                    raise
+                        extracted_text = article['text']
+                        title_text = article['title']
+                        extraction_method = article['method']
+                        
+                        # Check if we got redirected to a proper article
+                        if is_google_news:
+                            if 'news.google.com' not in article['final_url']:
+                                st.success(f"✅ Found article at: {urlparse(article['final_url']).netloc}")
                             else:
-                                # Regular URL - make request
-                                response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-                            
-                            response.raise_for_status()
-                            
-                            # Parse HTML with better encoding handling
-                            response.encoding = response.apparent_encoding
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            
-                            # Get page title for context
-                            page_title = soup.find('title')
-                            title_text = page_title.get_text().strip() if page_title else ""
-                            
-                            # Remove unwanted elements more aggressively
-                            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 
-                                               'noscript', 'button', 'form', 'img', 'svg', 'video', 'audio']):
-                                element.decompose()
-                            
-                            # Try multiple extraction methods
-                            extracted_text = ""
-                            extraction_method = ""
-                            
-                            # Method 1: Look for specific news article structures
-                            article_selectors = [
-                                soup.find('article'),
-                                soup.find('div', class_=re.compile(r'article[-_]?body|article[-_]?content|story[-_]?body|post[-_]?content', re.I)),
-                                soup.find('div', id=re.compile(r'article|story|content|post', re.I)),
-                                soup.find('main')
-                            ]
-                            
-                            for selector in article_selectors:
-                                if selector and not extracted_text:
-                                    paragraphs = selector.find_all(['p', 'h2', 'h3'])
-                                    text_parts = [p.get_text().strip() for p in paragraphs if p.get_text().strip() and len(p.get_text().strip()) > 30]
-                                    if text_parts:
-                                        extracted_text = ' '.join(text_parts)
-                                        extraction_method = "article structure"
-                                        break
-                            
-                            # Method 2: Find the longest paragraph-rich container
-                            if not extracted_text:
-                                divs = soup.find_all('div')
-                                best_div = None
-                                max_para_count = 0
-                                
-                                for div in divs:
-                                    paras = div.find_all('p', recursive=False)
-                                    if len(paras) > max_para_count:
-                                        max_para_count = len(paras)
-                                        best_div = div
-                                
-                                if best_div and max_para_count >= 3:
-                                    paragraphs = best_div.find_all('p')
-                                    text_parts = [p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 30]
-                                    extracted_text = ' '.join(text_parts)
-                                    extraction_method = "paragraph container"
-                            
-                            # Method 3: Get all meaningful paragraphs (relaxed filtering)
-                            if not extracted_text:
-                                paragraphs = soup.find_all('p')
-                                text_parts = [p.get_text().strip() for p in paragraphs 
-                                            if len(p.get_text().strip()) > 30]
-                                # Take first 50 paragraphs to avoid getting too much junk
-                                if text_parts:
-                                    extracted_text = ' '.join(text_parts[:50])
-                                    extraction_method = "all paragraphs"
-                            
-                            # Method 4: Last resort - get ALL text content
-                            if not extracted_text:
-                                # Get all text from body, split by sentences
-                                body = soup.find('body')
-                                if body:
-                                    all_text = body.get_text(separator=' ', strip=True)
-                                    # Clean up
-                                    all_text = re.sub(r'\s+', ' ', all_text).strip()
-                                    # Split into sentences and filter
-                                    sentences = re.split(r'[.!?]+', all_text)
-                                    meaningful_sentences = [s.strip() for s in sentences if len(s.strip()) > 50]
-                                    if meaningful_sentences:
-                                        extracted_text = '. '.join(meaningful_sentences[:30])  # Take first 30 sentences
-                                        extraction_method = "full body text"
-                            
-                            # Clean the extracted text
-                            if extracted_text:
-                                # Remove extra whitespace
-                                extracted_text = re.sub(r'\s+', ' ', extracted_text).strip()
-                                
-                                # Validate length (more lenient)
-                                if len(extracted_text) > 80:
-                                    news_text = extracted_text[:2500]  # Increased limit
-                                    st.success(f"✅ Text extracted successfully! ({len(extracted_text)} characters)")
-                                    if title_text:
-                                        st.info(f"📰 Article: {title_text[:100]}...")
-                                    if extraction_method:
-                                        st.caption(f"📍 Extraction method: {extraction_method}")
-                                    st.text_area("Extracted text preview:", 
-                                               value=news_text[:600] + "..." if len(news_text) > 600 else news_text, 
-                                               height=150, disabled=True)
-                                else:
-                                    st.error("❌ Extracted text is too short. The article might be behind a paywall or require login.")
-                                    st.info("💡 Try: Copy the article text manually and use 'Type/Paste Text' option")
-                                    news_text = ""
+                                st.warning("⚠️ Could not extract article from Google News. Try opening the article directly and copying its URL.")
+                                st.error("❌ Google News links often can't be extracted directly. Please:")
+                                st.info("1. Click the Google News link to open the article\n2. Copy the URL from the article page\n3. Paste that URL here instead")
+                                raise Exception("Google News redirect failed")
+                        
+                        if extracted_text:
+                            # Validate length (more lenient)
+                            if len(extracted_text) > _MIN_ARTICLE_CHARS:
+                                news_text = extracted_text[:2500]  # Increased limit
+                                # One element for the status lines instead of three
+                                summary_html = f"<div class='stSuccess' style='padding: 0.75rem 1rem; margin-bottom: 0.5rem;'>✅ Text extracted successfully! ({len(extracted_text)} characters)</div>"
+                                if title_text:
+                                    summary_html += f"<div class='stInfo' style='padding: 0.75rem 1rem; margin-bottom: 0.5rem;'>📰 Article: {html.escape(title_text[:100])}...</div>"
+                                if extraction_method:
+                                    summary_html += f"<div style='font-size: 0.8em; color: #666;'>📍 Extraction method: {extraction_method}</div>"
+                                # Read-only preview as static markup, not a disabled widget
+                                preview = news_text[:600] + "..." if len(news_text) > 600 else news_text
+                                summary_html += _PREVIEW_TMPL.format(text=html.escape(preview))
+                                st.markdown(summary_html, unsafe_allow_html=True)
                             else:
-                                st.error("❌ Could not extract meaningful text from this URL.")
-                                st.info("💡 Possible reasons:\n- Article behind paywall\n- JavaScript-heavy website\n- Login required\n\n→ Copy the text manually and paste it instead.")
-                                # Debug info
-                                st.expander("🔍 Debug Info").write(f"Page title: {title_text}\nResponse status: {response.status_code}\nContent length: {len(response.text)} chars")
+                                st.error("❌ Extracted text is too short. The article might be behind a paywall or require login.")
+                                st.info("💡 Try: Copy the article text manually and use 'Type/Paste Text' option")
                                 news_text = ""
-                                
+                        else:
+                            st.error("❌ Could not extract meaningful text from this URL.")
+                            st.info("💡 Possible reasons:\n- Article behind paywall\n- JavaScript-heavy website\n- Login required\n\n→ Copy the text manually and paste it instead.")
+                            # Debug info
+                            if AppConfig.DEBUG:
+                                st.expander("🔍 Debug Info").write(f"Page title: {title_text}\nResponse status: {article['status_code']}\nContent length: {article['page_size']} bytes")
+                            news_text = ""
+                            
                     except requests.exceptions.Timeout:
                         st.error("❌ Request timeout. The website took too long to respond. Please try again.")
                         news_text = ""
                     except requests.exceptions.ConnectionError:
                         st.error("❌ Connection error. Please check your internet connection and try again.")
                         news_text = ""
+                    except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError):
+                        st.error("❌ The page download was interrupted or could not be decoded. Please try again.")
+                        news_text = ""
                     except requests.exceptions.HTTPError as e:
                         st.error(f"❌ HTTP Error: {e.response.status_code}. The URL may be invalid or blocked.")
                         news_text = ""
@@ -920,15 +1425,29 @@ class BeautifulUI:
                         st.error(f"❌ Error extracting URL: {str(e)[:100]}")
                         st.info("💡 Tip: Try copying the news text manually and using 'Type/Paste Text' option instead.")
                         news_text = ""
-        st.markdown("---")
-        
-        # Action buttons (full width)
-        verify_clicked = st.button("🔍 Verify News", type="primary", use_container_width=True)
-        example_clicked = st.button("🧪 Try Example", use_container_width=True)
-        clear_clicked = st.button("🔄 Clear", use_container_width=True)
         
-        if clear_clicked:
-            st.rerun()
+        # The text box and buttons share a form: editing the text does not
+        # rerun the script, values are only sent when the form is submitted.
+        # The input method stays outside so switching it still swaps the
+        # input widget straight away.
+        with st.form("verify_form", clear_on_submit=False):
+            if input_method == "✏️ Type/Paste Text":
+                news_text = st.text_area(
+                    "Enter the news claim:",
+                    height=150,
+                    placeholder="Click here and start typing... Example: PM Modi announced new education policy today...",
+                    help="Click in the text box to start typing or paste the news text you want to verify",
+                    key="news_text_input"
+                )
+            st.markdown("---")
+            
+            # Action buttons (full width)
+            verify_clicked = st.form_submit_button("🔍 Verify News", type="primary", use_container_width=True)
+            example_clicked = st.form_submit_button("🧪 Try Example", use_container_width=True)
+            # The callback resets state before the click's own rerun, so no
+            # second st.rerun() pass is needed
+            st.form_submit_button("🔄 Clear", use_container_width=True,
+                                  on_click=BeautifulUI._clear_inputs)
         
         # Handle example button
         if example_clicked:
@@ -937,106 +1456,40 @@ class BeautifulUI:
         return news_text, verify_clicked, False
     
     @staticmethod
+    @st.fragment
     def render_results(result_data):
-        """Render verification results beautifully"""
-        if not result_data['success']:
-            st.error(result_data['analysis'])
+        """
+        Render verification results beautifully
+        Runs as a fragment: the download button only reruns this block
+        """
+        if not result_data.success:
+            st.error(result_data.analysis)
             return
         
-        # Status indicators with warm, natural colors
-        status_config = {
-            'TRUE': {
-                'icon': '✅',
-                'color': '#81c784',
-                'bg': 'rgba(129, 199, 132, 0.15)',
-                'label': 'VERIFIED TRUE',
-                'message': 'This news appears to be accurate based on available information.'
-            },
-            'FALSE': {
-                'icon': '❌',
-                'color': '#e57373',
-                'bg': 'rgba(229, 115, 115, 0.15)',
-                'label': 'FAKE NEWS DETECTED',
-                'message': 'This news appears to be false or misleading.'
-            },
-            'PARTIALLY_TRUE': {
-                'icon': '⚠️',
-                'color': '#ffb74d',
-                'bg': 'rgba(255, 183, 77, 0.15)',
-                'label': 'PARTIALLY TRUE',
-                'message': 'This news contains some truth but also inaccurate elements.'
-            },
-            'UNVERIFIED': {
-                'icon': '❓',
-                'color': '#7b93a7',
-                'bg': 'rgba(123, 147, 167, 0.15)',
-                'label': 'UNVERIFIED',
-                'message': 'Insufficient information to verify this claim.'
-            }
-        }
+        config = _STATUS_CONFIG.get(result_data.status, _STATUS_CONFIG['UNVERIFIED'])
         
-        config = status_config.get(result_data['status'], status_config['UNVERIFIED'])
+        # Verdict, confidence and the analysis header go out as one element
+        html_parts = [_VERDICT_TMPL.format(**config)]
         
-        # 1. BIG VERDICT BOX
-        st.markdown(f"""
-        <div style='background: {config["bg"]}; border: 3px solid {config["color"]}; border-radius: 15px; padding: 2rem; text-align: center; margin-bottom: 1.5rem; box-shadow: 0 4px 15px rgba(0,0,0,0.1);'>
-            <div style='font-size: 3rem; margin-bottom: 0.5rem;'>{config["icon"]}</div>
-            <h2 style='color: {config["color"]}; font-size: 1.8rem; margin: 0.5rem 0; font-weight: 700;'>{config["label"]}</h2>
-            <p style='color: #4a4a4a; font-size: 1rem; margin-top: 0.5rem;'>{config["message"]}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        # CONFIDENCE SCORE - Big and prominent
+        confidence = result_data.confidence
+        _, conf_color, conf_label = next(
+            (tier for tier in _CONF_TIERS if confidence >= tier[0]), _CONF_TIERS[-1])
+        html_parts.append(_CONFIDENCE_TMPL.format(color=conf_color, label=conf_label, confidence=confidence))
         
-        # 2. CONFIDENCE SCORE - Big and prominent
-        confidence = result_data['confidence']
-        conf_color = '#81c784' if confidence >= 70 else '#ffb74d' if confidence >= 50 else '#e57373'
-        conf_label = 'High Confidence' if confidence >= 70 else 'Moderate Confidence' if confidence >= 50 else 'Low Confidence'
-        
-        st.markdown(f"""
-        <div style='background: rgba(255, 255, 255, 0.9); border-radius: 12px; padding: 1.5rem; margin-bottom: 1.5rem; border: 2px solid #e0d5c1;'>
-            <h3 style='color: #5d4037; margin: 0 0 1rem 0; font-size: 1.1rem;'>🎯 AI Confidence Score</h3>
-            <div style='text-align: center; margin-bottom: 1rem;'>
-                <div style='font-size: 3rem; font-weight: 700; color: {conf_color};'>{confidence}%</div>
-                <div style='font-size: 0.9rem; color: #6d6d6d; font-weight: 500;'>{conf_label}</div>
-            </div>
-            <div style='background: #e0e0e0; height: 25px; border-radius: 12px; overflow: hidden;'>
-                <div style='background: {conf_color}; height: 100%; width: {confidence}%; transition: width 0.5s;'></div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        html_parts.append(_ANALYSIS_HEADER_HTML)
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
         
-        # 3. AI ANALYSIS - Clear and readable
-        st.markdown("""
-        <div style='background: rgba(255, 255, 255, 0.9); border-radius: 12px; padding: 1.5rem; margin-bottom: 1.5rem; border: 2px solid #e0d5c1;'>
-            <h3 style='color: #5d4037; margin: 0 0 1rem 0; font-size: 1.1rem;'>🧠 AI Analysis & Evidence</h3>
-        </div>
-        """, unsafe_allow_html=True)
+        # AI ANALYSIS - its own element without unsafe_allow_html, so the
+        # model's markdown (bold, lists) renders while any HTML in the reply
+        # stays inert and cannot break out into the cards around it
+        with st.container(border=True):
+            st.markdown(result_data.analysis)
         
-        st.markdown(f"""
-        <div style='background: #fafafa; border-left: 4px solid {config["color"]}; padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;'>
-            <div style='color: #3d3d3d; font-size: 0.95rem; line-height: 1.8; white-space: pre-wrap;'>{result_data['analysis']}</div>
-        </div>
-        """, unsafe_allow_html=True)
+        # TRUSTED NEWS SOURCES - header card and grid
+        st.markdown(_SOURCES_HEADER_HTML + _SOURCES_HTML + "<br>", unsafe_allow_html=True)
         
-        # 4. TRUSTED NEWS SOURCES - Prominent display
-        st.markdown("""
-        <div style='background: rgba(255, 255, 255, 0.9); border-radius: 12px; padding: 1.5rem; margin-bottom: 1.5rem; border: 2px solid #e0d5c1;'>
-            <h3 style='color: #5d4037; margin: 0 0 1rem 0; font-size: 1.1rem;'>� Verify from Trusted Sources</h3>
-            <p style='color: #6d6d6d; font-size: 0.85rem; margin-bottom: 1rem;'>Cross-check this news with these reliable sources:</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Display sources in a grid
-        cols = st.columns(2)
-        for idx, source in enumerate(AppConfig.TRUSTED_SOURCES):
-            with cols[idx % 2]:
-                st.markdown(f"""
-                <div style='background: #f7f3e9; padding: 0.8rem; border-radius: 8px; margin-bottom: 0.5rem; border-left: 3px solid #81c784;'>
-                    <div style='color: #5d4037; font-weight: 600; font-size: 0.9rem;'>✓ {source}</div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # 5. RECOMMENDATION based on confidence
-        st.markdown("<br>", unsafe_allow_html=True)
+        # RECOMMENDATION based on confidence
         if confidence <= 50:
             st.warning("⚠️ **Action Required**: Low confidence detected. Please verify this news from multiple trusted sources before believing or sharing.")
         elif confidence <= 70:
@@ -1044,15 +1497,10 @@ class BeautifulUI:
         else:
             st.success("✅ **Good Confidence**: The AI analysis is strong, but always verify important news from official sources before taking action.")
         
-        # 6. TIMESTAMP
-        st.markdown(f"""
-        <div style='text-align: center; color: #6d6d6d; font-size: 0.85rem; margin-top: 1.5rem;'>
-            ⏰ Analysis performed at: <strong>{result_data['timestamp']}</strong>
-        </div>
-        """, unsafe_allow_html=True)
+        # TIMESTAMP
+        st.markdown(_TIMESTAMP_TMPL.format(timestamp=result_data.timestamp), unsafe_allow_html=True)
         
         # Download report
-        st.markdown("<br>", unsafe_allow_html=True)
         BeautifulUI.render_download_section(result_data)
     
     @staticmethod
@@ -1068,20 +1516,22 @@ class BeautifulUI:
         report = {
             'verification_report': {
                 'news_claim': st.session_state.get('last_query', ''),
-                'status': result_data['status'],
-                'confidence': f"{result_data['confidence']}%",
-                'analysis': result_data['analysis'],
-                'timestamp': result_data['timestamp'],
+                'status': result_data.status,
+                'confidence': f"{result_data.confidence}%",
+                'analysis': result_data.analysis,
+                'timestamp': result_data.timestamp,
                 'recommended_sources': AppConfig.TRUSTED_SOURCES,
                 'disclaimer': 'This is an AI-assisted analysis. Always verify with multiple sources.'
             }
         }
         
-        filename = f"news_verification_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        # Named after the analysis time, so the button's props stay the same
+        # on every rerun for the same result
+        filename = f"news_verification_{result_data.timestamp.translate(_FILENAME_TS)}.json"
         
         st.download_button(
             "📄 Download Detailed Report (JSON)",
-            data=json.dumps(report, indent=2, ensure_ascii=False),
+            data=orjson.dumps(report, option=orjson.OPT_INDENT_2),
             file_name=filename,
             mime="application/json",
             help="Download complete verification report",
@@ -1098,9 +1548,8 @@ def main():
     # Setup page
     BeautifulUI.setup_page_config()
     
-    # Initialize session state
-    if 'verifier' not in st.session_state:
-        st.session_state.verifier = IndianNewsVerifier()
+    # Shared verification engine (kept per server process once its setup succeeds)
+    verifier = get_verifier()
     
     # Render UI components
     BeautifulUI.render_header()
@@ -1111,113 +1560,43 @@ def main():
     
     with col1:
         # Left column: Input form
-        st.markdown("""
-        <div style='text-align: center;'>
-            <h3 style='color: #546e7a;'>📝 INPUT</h3>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_INPUT_HEADING_HTML, unsafe_allow_html=True)
         news_text, verify_clicked, is_example = BeautifulUI.render_verification_form()
     
     with col2:
         # Middle column: Results
-        st.markdown("""
-        <div style='text-align: center;'>
-            <h3 style='color: #546e7a;'>📊 ANALYSIS</h3>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_RESULTS_HEADING_HTML, unsafe_allow_html=True)
+        
+        # Process verification before the results render, so the new result
+        # shows in this same run without a second st.rerun() pass
+        if (verify_clicked and news_text.strip()) or is_example:
+            st.session_state.last_query = news_text
+            
+            with st.spinner("🤖 AI is analyzing the news claim..."):
+                # Perform verification
+                st.session_state.last_result = verifier.verify_news(news_text)
         
         if 'last_result' not in st.session_state:
             # Initial state: show placeholder
-            st.markdown("""
-            <div style='text-align: center; padding: 2.5rem 1rem; background: rgba(255, 255, 255, 0.8); border-radius: 12px; border: 2px solid #e0d5c1; box-shadow: 0 2px 12px rgba(0, 0, 0, 0.08);'>
-                <h2 style='color: #5d4037; font-size: 1.5rem;'>⚡ Ready to Analyze</h2>
-                <p style='color: #4a4a4a; margin-top: 1rem; font-size: 0.95rem;'>
-                    Enter news text in the input panel and click <strong style="color: #5d4037;">Verify News</strong> to begin analysis.
-                </p>
-                <p style='color: #6d6d6d; margin-top: 1.5rem; font-size: 0.9rem;'>
-                    💡 Try the example to see the AI in action!
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_PLACEHOLDER_HTML, unsafe_allow_html=True)
         else:
             # Display stored results
             BeautifulUI.render_results(st.session_state.last_result)
     
     with col3:
         # Right column: Quick stats and tips
-        st.markdown("""
-        <div style='text-align: center;'>
-            <h3 style='color: #546e7a;'>💡 TIPS</h3>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style='background: rgba(255, 255, 255, 0.8); padding: 1rem; border-radius: 10px; border: 2px solid #e0d5c1; margin-bottom: 1rem; box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);'>
-            <h4 style='color: #5d4037; font-size: 1.05rem;'>🎯 Quick Tips</h4>
-            <ul style='color: #4a4a4a; font-size: 0.85rem;'>
-                <li>Paste full news articles for better accuracy</li>
-                <li>Check multiple sources</li>
-                <li>Look for official sources</li>
-                <li>Be wary of sensational headlines</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style='background: rgba(255, 255, 255, 0.8); padding: 1rem; border-radius: 10px; border: 2px solid #e0d5c1; margin-bottom: 1rem; box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);'>
-            <h4 style='color: #5d4037; font-size: 1.05rem;'>📈 Status Guide</h4>
-            <p style='color: #4a4a4a; font-size: 0.8rem; margin: 0.5rem 0;'>
-                🟢 <strong style="color: #6bb86f;">TRUE</strong><br/>
-                Verified information
-            </p>
-            <p style='color: #4a4a4a; font-size: 0.8rem; margin: 0.5rem 0;'>
-                🔴 <strong style="color: #e57373;">FALSE</strong><br/>
-                Identified as fake
-            </p>
-            <p style='color: #4a4a4a; font-size: 0.8rem; margin: 0.5rem 0;'>
-                🟡 <strong style="color: #ffb74d;">PARTIAL</strong><br/>
-                Mixed information
-            </p>
-            <p style='color: #4a4a4a; font-size: 0.8rem; margin: 0.5rem 0;'>
-                ⚪ <strong style="color: #7b93a7;">UNVERIFIED</strong><br/>
-                Insufficient data
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_TIPS_COLUMN_HTML, unsafe_allow_html=True)
         
         if 'last_result' in st.session_state:
-            st.success(f"✅ Last analysis: {st.session_state.last_result['timestamp'].split()[1]}")
+            st.success(f"✅ Last analysis: {st.session_state.last_result.timestamp.partition(' ')[2]}")
         else:
             st.info("⏳ Waiting for input...")
     
-    # Process verification
-    if (verify_clicked and news_text.strip()) or is_example:
-        st.session_state.last_query = news_text
-        
-        with st.spinner("🤖 AI is analyzing the news claim..."):
-            # Add realistic delay for better UX
-            time.sleep(1)
-            
-            # Perform verification
-            result = st.session_state.verifier.verify_news(news_text)
-            st.session_state.last_result = result
-        
-        # Rerun to show results in right column
-        st.rerun()
-    
-    elif verify_clicked and not news_text.strip():
+    if verify_clicked and not news_text.strip() and not is_example:
         st.warning("⚠️ Please enter some news text to verify!")
     
-    # Footer
-    st.markdown("---")
-    st.markdown("""
-    <div style='text-align: center; color: #7F8C8D; padding: 2rem 0;'>
-        <p><strong>🕵️‍♂️ Fake News Verifier</strong> • Fighting Misinformation with AI</p>
-        <p>Built with Streamlit • Powered by Advanced AI • Version 2.0</p>
-        <p style='font-family: "Courier New", Courier, monospace;'><em>Made with 📰 by Debasmita X Manisha X Joita</em></p>
-        <p><small>Always cross-reference important news with multiple reliable sources</small></p>
-    </div>
-    """, unsafe_allow_html=True)
+    # Footer (divider and credits in one element)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 # ============================================
 # APPLICATION ENTRY POINT
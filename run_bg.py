@@ -4,6 +4,7 @@ It does not modify git or commit files.
 """
 import base64
 import os
+import re
 import subprocess
 from pathlib import Path
 
@@ -15,6 +16,11 @@ if not svg_path.exists():
 with svg_path.open('rb') as f:
     b = f.read()
 
+# Drop the XML declaration and comments before encoding: they only inflate
+# the data URI (browsers won't gunzip data URIs). Whitespace between tags is
+# kept, since it is significant inside <text>/<tspan> content
+b = re.sub(rb'<\?xml.*?\?>|<!--.*?-->', b'', b, flags=re.S).strip()
+
 b64 = base64.b64encode(b).decode('ascii')
 bg = 'data:image/svg+xml;base64,' + b64
 
@@ -26,7 +32,12 @@ python_exe = os.environ.get('PYTHON_EXECUTABLE') or 'python'
 
 cmd = [python_exe, '-m', 'streamlit', 'run', str(Path(__file__).resolve().parents[0] / 'main_beautiful.py'), '--server.port', '8501']
 print('Launching Streamlit with command:', ' '.join(cmd))
-print('Background data-URI length:', len(bg))
+print('Background data-URI length:', len(bg), flush=True)
 
-# Launch Streamlit (will run until stopped)
-subprocess.run(cmd, env=env)
+# Launch Streamlit (will run until stopped). On POSIX the launcher is
+# replaced by Streamlit in place instead of idling as a parent process;
+# Windows has no real exec, so it still waits on a child there.
+if os.name == 'posix':
+    os.execvpe(cmd[0], cmd, env)
+else:
+    subprocess.run(cmd, env=env)